@@ -1,7 +1,16 @@
-import boto3, time, os, json, http.client, urllib.request, urllib.parse, urllib.error, base64
+import time, os, json, logging, urllib.parse, base64
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from botocore.exceptions import ClientError
+
+# --- 로깅 설정 (LOG_LEVEL 환경 변수, 대소문자 무관, 알 수 없는 값이면 INFO) ---
+log = logging.getLogger()
+LOG_LEVEL = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').strip().upper())
+log.setLevel(LOG_LEVEL if isinstance(LOG_LEVEL, int) else logging.INFO)
 
 # --- Webhook URL 환경 변수 ---
 DISCORD_URL = os.environ.get('DISCORD_WEBHOOK_URL')
+NOTIFY_TIMEOUT = 3  # 알림 전송 최대 대기 시간 (초)
 
 # --- Beanstalk 환경 변수 ---
 BEANSTALK_ENV_ID = os.environ.get('BEANSTALK_ENV_ID')  # 환경 ID 우선
@@ -9,30 +18,108 @@ BEANSTALK_ENV_NAME = os.environ.get('BEANSTALK_ENV_NAME')  # 환경 이름 대
 CHECK_URL = os.environ.get('CHECK_URL')
 MAX_WAIT = int(os.environ.get('MAX_WAIT', 60))
 INTERVAL = int(os.environ.get('INTERVAL', 30))
+WARMUP_DELAYS = (1, 2, 4, 8, 15)  # 배포 직후 안정화 대기 백오프
+WARMUP_MAX = 30  # 안정화 대기 전체 상한 (초, 프로브 시간 포함)
+
+# DynamoDB Stream NewImage에서 검증 대상(Deploy 성공) 여부를 바로 비교하기 위한 값
+DEPLOY_S = {'S': 'Deploy'}
+SUCCEEDED_S = {'S': 'SUCCEEDED'}
+
+# --- DynamoDB 상태 테이블 (writer.py가 기록하는 LATEST_EXECUTION 포인터 조회용) ---
+TABLE_NAME = os.environ.get('TABLE_NAME', 'deploy-land-status')
+PK_NAME = "pipelineID"
+_status_table = None
+
+def status_table():
+    global _status_table
+    if _status_table is None:
+        import boto3
+        _status_table = boto3.resource('dynamodb').Table(TABLE_NAME)
+    return _status_table
+
+# Beanstalk 클라이언트는 첫 사용 시 생성 (콜드 스타트 시 boto3 로딩 지연)
+_beanstalk = None
+
+def beanstalk():
+    global _beanstalk
+    if _beanstalk is None:
+        import boto3
+        # 리전 명시
+        _beanstalk = boto3.client('elasticbeanstalk', region_name='ap-northeast-2')
+    return _beanstalk
+
+# Beanstalk 헬스 조회와 HTTP 확인을 동시에 실행하기 위한 스레드 풀 (warm 컨테이너에서 재사용)
+# 시간 초과된 확인이 워커를 잡고 있어도 다음 반복이 밀리지 않도록 여유분 확보
+_executor = ThreadPoolExecutor(max_workers=4)
+
+# CHECK_URL 헬스 프로브용 커넥션 풀 (반복마다 TCP/TLS 핸드셰이크 생략)
+PROBE_CONNECT_TIMEOUT = 2
+PROBE_READ_TIMEOUT = 5
+_PROBE_TIMEOUT = urllib3.Timeout(connect=PROBE_CONNECT_TIMEOUT, read=PROBE_READ_TIMEOUT)
+_POOL = urllib3.PoolManager(num_pools=2, maxsize=4, timeout=_PROBE_TIMEOUT)
+# 연결/읽기 재시도는 하지 않되 리다이렉트는 기존 urlopen처럼 따라감
+_PROBE_RETRIES = urllib3.Retry(total=3, connect=0, read=0, redirect=3)
+
+# --- Beanstalk 조회 결과 캐시 (warm 컨테이너에서 재사용) ---
+ENV_CACHE_TTL = 300        # CHECK_URL (CNAME + HealthCheckPath)
+ENV_NAME_CACHE_TTL = 3600  # 환경 ID -> 환경 이름
+_ENV_CACHE = {"key": None, "data": None, "expires": 0}
+_ENV_NAME_CACHE = {"key": None, "data": None, "expires": 0}
+
+HEALTH_PATH_CACHE_TTL = 600  # 환경 이름 -> HealthCheckPath
+HEALTH_CHECK_PATH_OPTION = ("aws:elasticbeanstalk:environment:process:default", "HealthCheckPath")
+_HEALTH_PATH_CACHE = {}
+
+
+def _env_cache_key():
+    return (BEANSTALK_ENV_ID, BEANSTALK_ENV_NAME)
+
+
+def _cache_get(cache):
+    if cache["key"] == _env_cache_key() and time.monotonic() < cache["expires"]:
+        return cache["data"]
+    return None
+
+
+def _cache_set(cache, data, ttl):
+    cache["key"] = _env_cache_key()
+    cache["data"] = data
+    cache["expires"] = time.monotonic() + ttl
+
 
-# 리전 명시
-beanstalk = boto3.client('elasticbeanstalk', region_name='ap-northeast-2')
+def _invalidate_env_caches():
+    for cache in (_ENV_CACHE, _ENV_NAME_CACHE):
+        cache["key"] = None
+        cache["data"] = None
+        cache["expires"] = 0
+    _HEALTH_PATH_CACHE.clear()
 
 
 def lambda_handler(event, context):
-    print(f"📥 Received event: {json.dumps(event)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("📥 Received event: %s", json.dumps(event))
 
     # HTTP API v2 (API Gateway HTTP API) 요청 처리
     # HTTP API v2 이벤트는 top-level에 'requestContext'->'http' 키를 가집니다.
     if isinstance(event, dict) and event.get("requestContext") and event["requestContext"].get("http"):
-        print("🌐 Handling HTTP API request")
+        log.info("🌐 Handling HTTP API request")
         return handle_http_api_event(event)
 
     # DynamoDB Streams 이벤트 처리
     if 'Records' in event:
-        print("📦 Processing DynamoDB Stream records...")
+        log.info("📦 Processing DynamoDB Stream records...")
         for record in event['Records']:
             event_name = record['eventName']
-            print(f"🔄 Event: {event_name}")
+            log.info("🔄 Event: %s", event_name)
             
             # INSERT와 MODIFY 모두 처리 (재배포 포함)
             if event_name in ['INSERT', 'MODIFY']:
                 new_image = record['dynamodb'].get('NewImage', {})
+
+                # Deploy 성공 이벤트가 아니면 파싱 전에 바로 건너뜀
+                if new_image.get('currentStage') != DEPLOY_S or new_image.get('status') != SUCCEEDED_S:
+                    continue
+
                 pipeline_data = parse_dynamodb_item(new_image)
                 
                 # 검증 로직 실행
@@ -40,7 +127,7 @@ def lambda_handler(event, context):
                 if result:
                     return result
             else:
-                print(f"⏭️ Skipping {event_name} event")
+                log.info("⏭️ Skipping %s event", event_name)
         
         return {"statusCode": 200, "message": "Processed all records"}
     
@@ -53,21 +140,21 @@ def handle_http_api_event(event):
     """
     API Gateway HTTP API (v2) 이벤트 처리
     """
-    print("🌐 Handling HTTP API request for URL lookup...")
+    log.info("🌐 Handling HTTP API request for URL lookup...")
     
     try:
         # Beanstalk URL 가져오기
         check_url = get_auto_check_url()
         
         if not check_url:
-            print("❌ Failed to get Beanstalk URL.")
+            log.error("❌ Failed to get Beanstalk URL.")
             return {
                 "statusCode": 500,
                 "headers": {"Content-Type": "application/json"},
                 "body": json.dumps({"message": "Failed to retrieve Beanstalk environment URL."})
             }
             
-        print(f"✅ Successfully retrieved URL: {check_url}")
+        log.info("✅ Successfully retrieved URL: %s", check_url)
         
         # 조회한 URL을 JSON으로 즉시 반환
         return {
@@ -79,13 +166,13 @@ def handle_http_api_event(event):
             })
         }
     except Exception as e:
-        print(f"Error in handle_http_api_event: {e}")
+        log.error("Error in handle_http_api_event: %s", e)
         return {"statusCode": 500, "body": json.dumps({"message": "Internal error", "error": str(e)})}
 
 def process_pipeline_validation(pipeline_data):
     """파이프라인 검증 로직 - 실제 헬스체크 수행"""
     if not pipeline_data:
-        print("⚠️ Could not parse pipeline data from event")
+        log.warning("⚠️ Could not parse pipeline data from event")
         return {"statusCode": 400, "message": "Invalid event format"}
     
     pipeline_id = pipeline_data.get('pipelineID')
@@ -93,30 +180,47 @@ def process_pipeline_validation(pipeline_data):
     status = pipeline_data.get('status')
     log_url = pipeline_data.get('logUrl')
     
-    print(f"📦 Pipeline ID: {pipeline_id}")
-    print(f"📊 Current Stage: {current_stage}")
-    print(f"✅ Status: {status}")
+    log.info("📦 Pipeline ID: %s", pipeline_id)
+    log.info("📊 Current Stage: %s", current_stage)
+    log.info("✅ Status: %s", status)
     
     # Deploy 스테이지이면서 성공한 경우만 검증
     if current_stage != 'Deploy':
-        print(f"⏭️ Skipping - not Deploy stage (current: {current_stage})")
+        log.info("⏭️ Skipping - not Deploy stage (current: %s)", current_stage)
         return {"statusCode": 200, "message": "Skipped - not Deploy stage"}
     
     if status != 'SUCCEEDED':
-        print(f"⏭️ Skipping - status is {status}")
+        log.info("⏭️ Skipping - status is %s", status)
         return {"statusCode": 200, "message": f"Skipped - status is {status}"}
     
-    print(f"✅ Deploy stage succeeded - starting validation")
+    # 이미 더 나중에 시작된 실행이 있다면 이전 실행은 검증하지 않음
+    # (시작 시간으로 확인되지 않으면 포인터가 오래된 것일 수 있으므로 검증 계속)
+    latest = get_latest_execution()
+    latest_id = latest.get('latestExecutionId')
+    if latest_id and latest_id != pipeline_id:
+        latest_start = latest.get('lastStartTime')
+        own_start = pipeline_data.get('startTime')
+        if latest_start and own_start and latest_start > own_start:
+            log.warning("⏭️ Skipping %s - superseded by newer execution %s (started %s)", pipeline_id, latest_id, latest_start)
+            send_discord_notification(
+                f"⏭️ **[Deploy Skipped]** 더 최신 실행이 있어 배포 검증을 건너뜁니다.\n"
+                f"**Pipeline ID:** `{pipeline_id}`\n"
+                f"**최신 실행:** `{latest_id}`"
+            )
+            return {"statusCode": 200, "message": "Skipped - superseded"}
+        log.warning("⚠️ LATEST_EXECUTION points to %s but it is not confirmed newer than %s - validating anyway", latest_id, pipeline_id)
+
+    log.info("✅ Deploy stage succeeded - starting validation")
     
     # 환경 정보 가져오기
     env_identifier = BEANSTALK_ENV_ID or BEANSTALK_ENV_NAME
     if not env_identifier:
         error_msg = "Neither BEANSTALK_ENV_ID nor BEANSTALK_ENV_NAME is set in environment variables"
-        print(f"❌ {error_msg}")
+        log.error("❌ %s", error_msg)
         send_discord_notification(f"⚠️ **[Config Error]** {error_msg}")
         raise ValueError(error_msg)
     
-    print(f"🚀 Starting Beanstalk validation for environment: {env_identifier}")
+    log.info("🚀 Starting Beanstalk validation for environment: %s", env_identifier)
 
     # --- CHECK_URL 자동 결정 또는 환경 변수 사용 ---
     global CHECK_URL
@@ -124,19 +228,29 @@ def process_pipeline_validation(pipeline_data):
         CHECK_URL = get_auto_check_url()
         if not CHECK_URL:
             error_msg = f"Failed to auto-detect CHECK_URL"
-            print(f"❌ {error_msg}")
+            log.error("❌ %s", error_msg)
             send_discord_notification(
                 f"⚠️ **[Config Error]** {error_msg}\n"
                 f"Please set CHECK_URL in environment variables."
             )
             raise ValueError(error_msg)
-        print(f"✅ Auto-detected CHECK_URL: {CHECK_URL}")
+        log.info("✅ Auto-detected CHECK_URL: %s", CHECK_URL)
     else:
-        print(f"✅ Using configured CHECK_URL: {CHECK_URL}")
+        log.info("✅ Using configured CHECK_URL: %s", CHECK_URL)
 
-    # --- 배포 직후 대기 ---
-    print(f"⏳ Waiting 30 seconds for environment to stabilize...")
-    time.sleep(30)
+    # --- 배포 직후 대기 (첫 2xx 응답까지 지수 백오프, 프로브 포함 최대 WARMUP_MAX초) ---
+    log.info("⏳ Waiting up to %s seconds for environment to stabilize...", WARMUP_MAX)
+    warmup_deadline = time.monotonic() + WARMUP_MAX
+    for attempt, delay in enumerate(WARMUP_DELAYS, 1):
+        http_ok, _ = check_http(CHECK_URL, deadline=warmup_deadline)
+        if http_ok:
+            log.info("✅ Environment responded during warmup")
+            break
+        remaining = warmup_deadline - time.monotonic()
+        # 마지막 시도 후에는 바로 검증 루프가 확인하므로 대기하지 않음
+        if attempt == len(WARMUP_DELAYS) or remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
 
     # --- 상태 검증 루프 ---
     start_time = time.time()
@@ -144,40 +258,38 @@ def process_pipeline_validation(pipeline_data):
     reason = ""
 
     while time.time() - start_time < MAX_WAIT:
+        iteration_start = time.monotonic()
         try:
-            # Beanstalk 헬스 상태 확인
-            status_response = describe_environment_health()
+            # Beanstalk 헬스 상태와 HTTP 응답을 동시에 확인
+            # 두 확인 모두 INTERVAL 안에 끝나야 함 (초과 시 이번 반복은 비정상으로 처리)
+            health_future = _executor.submit(describe_environment_health)
+            http_future = _executor.submit(check_http, CHECK_URL)
+            deadline = iteration_start + INTERVAL
+            status_response = health_future.result(timeout=max(0, deadline - time.monotonic()))
+            http_ok, http_reason = http_future.result(timeout=max(0, deadline - time.monotonic()))
+
             if status_response:
                 color = status_response.get('Color', 'Unknown')
                 health = status_response.get('HealthStatus', 'Unknown')
-                print(f"Beanstalk Health: Color={color}, Status={health}")
+                log.info("Beanstalk Health: Color=%s, Status=%s", color, health)
             else:
                 color = 'green'  # 헬스 체크 실패 시 HTTP로만 확인
 
-            # HTTP 응답 확인
             if color.lower() == 'green' or not status_response:
-                try:
-                    req = urllib.request.Request(CHECK_URL, method='GET')
-                    with urllib.request.urlopen(req, timeout=10) as response:
-                        status_code = response.getcode()
-                        if status_code == 200:
-                            success = True
-                            break
-                        else:
-                            reason = f"HTTP {status_code} from {CHECK_URL}"
-                except urllib.error.HTTPError as e:
-                    reason = f"HTTP {e.code} from {CHECK_URL}"
-                except urllib.error.URLError as e:
-                    reason = f"URL error: {str(e.reason)}"
-                except Exception as e:
-                    reason = f"HTTP request failed: {str(e)}"
+                if http_ok:
+                    success = True
+                    break
+                reason = http_reason
             else:
                 reason = f"Beanstalk not healthy: {color}/{health}"
 
+        except FutureTimeoutError:
+            reason = f"Health checks did not finish within {INTERVAL}s"
         except Exception as e:
             reason = f"Error checking Beanstalk: {str(e)}"
 
-        time.sleep(INTERVAL)
+        # 이번 반복에서 이미 소요된 시간만큼 대기 시간 차감
+        time.sleep(max(0, INTERVAL - (time.monotonic() - iteration_start)))
 
     # --- 결과 보고 ---
     env_display = BEANSTALK_ENV_NAME or BEANSTALK_ENV_ID
@@ -190,7 +302,7 @@ def process_pipeline_validation(pipeline_data):
             f"서비스가 정상적으로 동작 중입니다. 🎉"
         )
         send_discord_notification(message)
-        print("✅ Validation succeeded")
+        log.info("✅ Validation succeeded")
         return {"statusCode": 200, "status": "success", "details": message}
     else:
         message = (
@@ -202,73 +314,118 @@ def process_pipeline_validation(pipeline_data):
             f"**로그:** {log_url}"
         )
         send_discord_notification(message)
-        print("❌ Validation failed")
+        log.error("❌ Validation failed")
         return {"statusCode": 500, "status": "failed", "details": message}
 
 
+def get_latest_execution():
+    """
+    writer.py가 기록한 LATEST_EXECUTION 포인터 조회 (실패 시 {} -> 검증 계속)
+    """
+    try:
+        return status_table().get_item(Key={PK_NAME: 'LATEST_EXECUTION'}).get('Item', {})
+    except Exception as e:
+        log.warning("⚠️ Failed to get LATEST_EXECUTION: %s", e)
+        return {}
+
+
+def check_http(url, deadline=None):
+    """
+    CHECK_URL HTTP 응답 확인 - (성공 여부, 실패 사유) 반환
+    deadline(time.monotonic 기준)이 주어지면 요청 시간을 남은 시간으로 제한
+    """
+    def timeout():
+        if deadline is None:
+            return _PROBE_TIMEOUT
+        return urllib3.Timeout(total=max(0.1, deadline - time.monotonic()), connect=PROBE_CONNECT_TIMEOUT, read=PROBE_READ_TIMEOUT)
+
+    try:
+        # 상태 코드만 필요하므로 HEAD 요청 (HEAD 미지원 시 GET으로 대체)
+        response = _POOL.request('HEAD', url, retries=_PROBE_RETRIES, timeout=timeout())
+        if response.status == 405:
+            response = _POOL.request('GET', url, retries=_PROBE_RETRIES, timeout=timeout())
+        status_code = response.status
+        if status_code == 200:
+            return True, ""
+        return False, f"HTTP {status_code} from {url}"
+    except urllib3.exceptions.HTTPError as e:
+        return False, f"URL error: {str(e)}"
+    except Exception as e:
+        return False, f"HTTP request failed: {str(e)}"
+
+
 def get_auto_check_url():
     """
     Elastic Beanstalk 환경 설정에서 도메인 + 헬스체크 경로를 자동으로 가져옴
     환경 ID 우선, 환경 이름 대체
     """
+    cached_url = _cache_get(_ENV_CACHE)
+    if cached_url:
+        log.info("✅ Using cached CHECK_URL: %s", cached_url)
+        return cached_url
+
     try:
         # 환경 조회 (ID 우선, 이름 대체)
         if BEANSTALK_ENV_ID:
-            print(f"🔍 Looking up EB environment by ID: {BEANSTALK_ENV_ID}")
-            envs = beanstalk.describe_environments(EnvironmentIds=[BEANSTALK_ENV_ID])
+            log.info("🔍 Looking up EB environment by ID: %s", BEANSTALK_ENV_ID)
+            envs = beanstalk().describe_environments(EnvironmentIds=[BEANSTALK_ENV_ID])
         elif BEANSTALK_ENV_NAME:
-            print(f"🔍 Looking up EB environment by name: {BEANSTALK_ENV_NAME}")
-            envs = beanstalk.describe_environments(EnvironmentNames=[BEANSTALK_ENV_NAME])
+            log.info("🔍 Looking up EB environment by name: %s", BEANSTALK_ENV_NAME)
+            envs = beanstalk().describe_environments(EnvironmentNames=[BEANSTALK_ENV_NAME])
         else:
-            print("❌ No environment ID or name provided")
+            log.error("❌ No environment ID or name provided")
             return None
         
         if not envs.get("Environments"):
-            print(f"❌ No environment found")
+            log.error("❌ No environment found")
             return None
         
         env = envs["Environments"][0]
         env_name = env.get("EnvironmentName")
         cname = env.get("CNAME", "")
         
-        print(f"✅ Found environment: {env_name}")
+        log.info("✅ Found environment: %s", env_name)
+        # describe_environment_health에서 ID -> 이름 조회를 다시 하지 않도록 공유
+        if env_name:
+            _cache_set(_ENV_NAME_CACHE, env_name, ENV_NAME_CACHE_TTL)
         
         if not cname:
-            print(f"❌ No CNAME found for environment")
+            log.error("❌ No CNAME found for environment")
             return None
         
         if not cname.startswith("http"):
             cname = "http://" + cname
         
-        print(f"✅ Found CNAME: {cname}")
+        log.info("✅ Found CNAME: %s", cname)
 
-        # 헬스체크 경로 가져오기 (환경 이름 필요)
-        try:
-            print(f"🔍 Getting configuration for: {env_name}")
-            settings = beanstalk.describe_configuration_settings(EnvironmentName=env_name)
-            option_settings = settings["ConfigurationSettings"][0]["OptionSettings"]
-            health_path = "/"
-            
-            for opt in option_settings:
-                if (
-                    opt["Namespace"] == "aws:elasticbeanstalk:environment:process:default"
-                    and opt["OptionName"] == "HealthCheckPath"
-                ):
-                    health_path = opt["Value"]
-                    print(f"✅ Found HealthCheckPath: {health_path}")
-                    break
-        except Exception as e:
-            print(f"⚠️ Could not get HealthCheckPath, using default '/': {e}")
-            health_path = "/"
+        # 헬스체크 경로 가져오기 (환경 이름 필요, 환경별 캐시)
+        health_path, expires = _HEALTH_PATH_CACHE.get(env_name, (None, 0))
+        if health_path is not None and time.monotonic() < expires:
+            log.info("✅ Using cached HealthCheckPath: %s", health_path)
+        else:
+            try:
+                log.info("🔍 Getting configuration for: %s", env_name)
+                settings = beanstalk().describe_configuration_settings(EnvironmentName=env_name)
+                option_settings = settings["ConfigurationSettings"][0]["OptionSettings"]
+                opts = {(opt["Namespace"], opt["OptionName"]): opt.get("Value") for opt in option_settings}
+                health_path = opts.get(HEALTH_CHECK_PATH_OPTION) or "/"
+                log.info("✅ Found HealthCheckPath: %s", health_path)
+                _HEALTH_PATH_CACHE[env_name] = (health_path, time.monotonic() + HEALTH_PATH_CACHE_TTL)
+            except Exception as e:
+                log.warning("⚠️ Could not get HealthCheckPath, using default '/': %s", e)
+                health_path = "/"
 
         final_url = cname.rstrip("/") + health_path
-        print(f"✅ Constructed CHECK_URL: {final_url}")
+        log.info("✅ Constructed CHECK_URL: %s", final_url)
+        _cache_set(_ENV_CACHE, final_url, ENV_CACHE_TTL)
         return final_url
         
+    except ClientError as e:
+        _invalidate_env_caches()
+        log.warning("⚠️ Failed to auto-detect CHECK_URL: %s", str(e))
+        return None
     except Exception as e:
-        print(f"⚠️ Failed to auto-detect CHECK_URL: {str(e)}")
-        import traceback
-        print(f"Stack trace: {traceback.format_exc()}")
+        log.exception("⚠️ Failed to auto-detect CHECK_URL: %s", e)
         return None
 
 
@@ -278,22 +435,30 @@ def describe_environment_health():
     """
     try:
         if BEANSTALK_ENV_ID:
-            # 환경 ID로 먼저 환경 이름 가져오기
-            envs = beanstalk.describe_environments(EnvironmentIds=[BEANSTALK_ENV_ID])
-            if envs.get("Environments"):
-                env_name = envs["Environments"][0].get("EnvironmentName")
-                return beanstalk.describe_environment_health(
+            # 환경 ID로 먼저 환경 이름 가져오기 (컨테이너 수명 동안 캐시)
+            env_name = _cache_get(_ENV_NAME_CACHE)
+            if not env_name:
+                envs = beanstalk().describe_environments(EnvironmentIds=[BEANSTALK_ENV_ID])
+                if envs.get("Environments"):
+                    env_name = envs["Environments"][0].get("EnvironmentName")
+                    _cache_set(_ENV_NAME_CACHE, env_name, ENV_NAME_CACHE_TTL)
+            if env_name:
+                return beanstalk().describe_environment_health(
                     EnvironmentName=env_name,
                     AttributeNames=['Color', 'HealthStatus']
                 )
         elif BEANSTALK_ENV_NAME:
-            return beanstalk.describe_environment_health(
+            return beanstalk().describe_environment_health(
                 EnvironmentName=BEANSTALK_ENV_NAME,
                 AttributeNames=['Color', 'HealthStatus']
             )
         return None
+    except ClientError as e:
+        _invalidate_env_caches()
+        log.warning("⚠️ Failed to get environment health: %s", e)
+        return None
     except Exception as e:
-        print(f"⚠️ Failed to get environment health: {e}")
+        log.warning("⚠️ Failed to get environment health: %s", e)
         return None
 
 
@@ -310,53 +475,69 @@ def parse_pipeline_event(event):
         
         return None
     except Exception as e:
-        print(f"Error parsing event: {e}")
+        log.error("Error parsing event: %s", e)
         return None
 
 
+# parse_dynamodb_item에서 읽는 필드
+_FIELDS = ('pipelineID', 'currentStage', 'status', 'errorMessage', 'logUrl', 'totalStages', 'stageList', 'aiSolution', 'startTime')
+
+# DynamoDB 타입 변환기도 첫 사용 시 생성 (건너뛰는 스트림 레코드에서는 boto3 로딩 안 함)
+_deserializer = None
+
+def deserializer():
+    global _deserializer
+    if _deserializer is None:
+        from boto3.dynamodb.types import TypeDeserializer
+        _deserializer = TypeDeserializer()
+    return _deserializer
+
+
 def parse_dynamodb_item(item):
     """DynamoDB 항목 형식을 일반 Python dict로 변환"""
     result = {}
-    
-    if 'pipelineID' in item and 'S' in item['pipelineID']:
-        result['pipelineID'] = item['pipelineID']['S']
-    
-    if 'currentStage' in item and 'S' in item['currentStage']:
-        result['currentStage'] = item['currentStage']['S']
-    
-    if 'status' in item and 'S' in item['status']:
-        result['status'] = item['status']['S']
-    
-    if 'errorMessage' in item and 'S' in item.get('errorMessage', {}):
-        result['errorMessage'] = item['errorMessage']['S']
-    
-    if 'logUrl' in item and 'S' in item.get('logUrl', {}):
-        result['logUrl'] = item['logUrl']['S']
-    
-    if 'totalStages' in item and 'N' in item.get('totalStages', {}):
-        result['totalStages'] = int(item['totalStages']['N'])
-    
-    if 'stageList' in item and 'L' in item.get('stageList', {}):
-        result['stageList'] = [stage['S'] for stage in item['stageList']['L']]
-    
-    if 'aiSolution' in item and 'S' in item.get('aiSolution', {}):
-        result['aiSolution'] = item['aiSolution']['S']
-    
+    for key in _FIELDS:
+        value = item.get(key)
+        if not value:
+            continue
+        # 형식이 잘못된 필드는 건너뜀 (예외가 나면 스트림 배치 전체가 재시도됨)
+        try:
+            value = deserializer().deserialize(value)
+        except Exception as e:
+            log.warning("⚠️ Skipping malformed field %s: %s", key, e)
+            continue
+        if value is not None:
+            result[key] = value
+
+    # 숫자는 Decimal로 디코딩되므로 int로 변환
+    if 'totalStages' in result:
+        try:
+            result['totalStages'] = int(result['totalStages'])
+        except (TypeError, ValueError):
+            del result['totalStages']
     return result
 
 
+# --- 웹훅 HTTPS 연결 재사용 (스레드 안전한 urllib3 풀, warm 컨테이너에서 유지) ---
+_WEBHOOK_POOL = urllib3.PoolManager(num_pools=2, maxsize=2, timeout=urllib3.Timeout(total=NOTIFY_TIMEOUT))
+# POST는 멱등이 아니므로 요청을 보내기 전 연결 실패만 한 번 재시도 (끊긴 keep-alive 연결은 풀이 재사용 전에 걸러냄)
+_WEBHOOK_RETRIES = urllib3.Retry(total=1, connect=1, read=0, redirect=0, status=0, other=0)
+
+def post_json(url_string, body):
+    return _WEBHOOK_POOL.request(
+        'POST', url_string,
+        body=json.dumps(body),
+        headers={'Content-Type': 'application/json'},
+        retries=_WEBHOOK_RETRIES
+    )
+
+
 def send_discord_notification(message):
     if not DISCORD_URL:
-        print("No Discord webhook URL set.")
+        log.warning("No Discord webhook URL set.")
         return
     try:
-        url = http.client.urlsplit(DISCORD_URL)
-        conn = http.client.HTTPSConnection(url.hostname)
-        payload = json.dumps({'content': message})
-        headers = {'Content-Type': 'application/json'}
-        conn.request("POST", url.path, payload, headers)
-        res = conn.getresponse()
-        print(f"Discord response: {res.status}")
-        conn.close()
+        res = post_json(DISCORD_URL, {'content': message})
+        log.info("Discord response: %s", res.status)
     except Exception as e:
-        print(f"Error sending Discord notification: {e}")
+        log.error("Error sending Discord notification: %s", e)
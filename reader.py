@@ -1,21 +1,40 @@
 import json
+import logging
 import boto3
+from boto3.dynamodb.types import TypeDeserializer
+from decimal import Decimal
 import os
 
+# --- 로깅 설정 (LOG_LEVEL 환경 변수, 대소문자 무관, 알 수 없는 값이면 INFO) ---
+log = logging.getLogger()
+LOG_LEVEL = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').strip().upper())
+log.setLevel(LOG_LEVEL if isinstance(LOG_LEVEL, int) else logging.INFO)
+
 # 1. DynamoDB 테이블 이름
 TABLE_NAME = "deploy-land-status"
 
-# Boto3 리소스를 초기화합니다.
-dynamodb = boto3.resource('dynamodb')
-table = dynamodb.Table(TABLE_NAME)
+# Boto3 저수준 클라이언트 (Resource 계층의 타입 변환 생략)
+dynamodb_client = boto3.client('dynamodb')
+deserializer = TypeDeserializer()
+
+# 2. 프론트엔드에서 사용하는 필드만 조회 (파이프라인 항목 + LATEST_EXECUTION 포인터)
+PROJECTION_EXPRESSION = "pipelineID, currentStage, #s, errorMessage, logUrl, aiSolution, stageList, totalStages, latestExecutionId, lastStartTime"
+PROJECTION_NAMES = {'#s': 'status'}
+
+# DynamoDB 숫자(Decimal)를 JSON 숫자로 변환
+def decimal_default(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 def lambda_handler(event, context):
-    print(f"Received event: {json.dumps(event)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Received event: %s", json.dumps(event))
 
     try:
         pipelineId = event['pathParameters']['pipelineId']
     except KeyError:
-        print("Error: 'pipelineId' missing from path parameters.")
+        log.error("Error: 'pipelineId' missing from path parameters.")
         return {
             'statusCode': 400,
             'body': json.dumps({'message': "Error: 'pipelineId' missing from path parameters."})
@@ -23,29 +42,33 @@ def lambda_handler(event, context):
 
     try:
         # 3. DynamoDB에서 GetItem 수행 (대소문자 수정됨)
-        response = table.get_item(
+        response = dynamodb_client.get_item(
+            TableName=TABLE_NAME,
             Key={
-                'pipelineID': pipelineId  
-            }
+                'pipelineID': {'S': pipelineId}
+            },
+            ProjectionExpression=PROJECTION_EXPRESSION,
+            ExpressionAttributeNames=PROJECTION_NAMES
         )
         
         if 'Item' not in response:
-            print(f"Item not found for pipelineId: {pipelineId}")
+            log.info("Item not found for pipelineId: %s", pipelineId)
             return {
                 'statusCode': 404,
                 'body': json.dumps({'message': f"Item not found for pipelineId: {pipelineId}"})
             }
         
-        item = response['Item']
-        print(f"Found item: {json.dumps(item)}")
+        item = {k: deserializer.deserialize(v) for k, v in response['Item'].items()}
+        body = json.dumps(item, default=decimal_default)
+        log.debug("Found item: %s", body)
         
         return {
             'statusCode': 200,
-            'body': json.dumps(item)
+            'body': body
         }
         
     except Exception as e:
-        print(f"DynamoDB error: {e}")
+        log.error("DynamoDB error: %s", e)
         return {
             'statusCode': 500,
             'body': json.dumps({'message': 'Internal server error', 'error': str(e)}) # 에러 메시지를 포함
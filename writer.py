@@ -1,32 +1,94 @@
 import json
+import logging
 import boto3
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
 import os
-import http.client 
+import re
+import time
+import hashlib
 import urllib.parse
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# --- 로깅 설정 (LOG_LEVEL 환경 변수, 대소문자 무관, 알 수 없는 값이면 INFO) ---
+log = logging.getLogger()
+LOG_LEVEL = logging.getLevelName(os.environ.get('LOG_LEVEL', 'INFO').strip().upper())
+log.setLevel(LOG_LEVEL if isinstance(LOG_LEVEL, int) else logging.INFO)
 
 # --- 1. DynamoDB 설정 ---
 TABLE_NAME = "deploy-land-status"
 PK_NAME = "pipelineID" # 사용자의 파티션 키 (D가 대문자)
 dynamodb = boto3.resource('dynamodb')
 table = dynamodb.Table(TABLE_NAME)
+serializer = TypeSerializer() # 저수준 클라이언트(transact_write_items)용 타입 변환
 
 # --- 2. 디스코드 & 슬랙 Webhook URL ---
 DISCORD_URL = os.environ.get('DISCORD_WEBHOOK_URL', None)
 SLACK_URL = os.environ.get('SLACK_WEBHOOK_URL', None)
+NOTIFY_TIMEOUT = 3 # 알림 전송 최대 대기 시간 (초)
+
+# 디스코드/슬랙 알림을 동시에 보내기 위한 스레드 풀 (warm 컨테이너에서 재사용)
+notify_executor = ThreadPoolExecutor(max_workers=2)
+
+# Bedrock 재시도: botocore adaptive 모드 (토큰 버킷 + 지터로 ThrottlingException 재시도)
+BEDROCK_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    read_timeout=10,
+    connect_timeout=3
+)
 
-# CodePipeline API에 접근하기 위한 클라이언트 생성
-codepipeline_client = boto3.client('codepipeline')
+# CodePipeline / Bedrock 클라이언트는 필요한 경로에서 처음 사용할 때 생성
+_codepipeline_client = None
+_bedrock_runtime = None
+
+# CodePipeline API에 접근하기 위한 클라이언트
+def codepipeline_client():
+    global _codepipeline_client
+    if _codepipeline_client is None:
+        _codepipeline_client = boto3.client('codepipeline')
+    return _codepipeline_client
 
 # Bedrock 클라이언트 리전 설정 + 사용 모델 설정
-bedrock_runtime = boto3.client('bedrock-runtime', region_name='ap-northeast-2')
-BEDROCK_MODEL_ID = "anthropic.claude-3-5-sonnet-20240620-v1:0"
+def bedrock_runtime():
+    global _bedrock_runtime
+    if _bedrock_runtime is None:
+        _bedrock_runtime = boto3.client('bedrock-runtime', region_name='ap-northeast-2', config=BEDROCK_CLIENT_CONFIG)
+    return _bedrock_runtime
+
+BEDROCK_MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0" # 3줄 요약에는 Haiku로 충분 (지연/비용 감소)
+BEDROCK_FALLBACK_MODEL_ID = "anthropic.claude-3-5-sonnet-20240620-v1:0"
+
+# Bedrock 응답 캐시 (별도 테이블, 상태 테이블 스트림/조회 API와 분리, DynamoDB TTL 7일)
+BEDROCK_CACHE_TABLE_NAME = os.environ.get('BEDROCK_CACHE_TABLE', 'deploy-land-bedrock-cache')
+BEDROCK_CACHE_PK_NAME = "cacheKey"
+BEDROCK_CACHE_TTL = 7 * 24 * 60 * 60
+bedrock_cache_table = dynamodb.Table(BEDROCK_CACHE_TABLE_NAME)
+# 실패 요약에서 실행마다 달라지는 값(시간, 인스턴스/빌드 ID, ARN 등) 제거용
+ERROR_NORMALIZE_PATTERNS = [
+    (re.compile(r'arn:aws[\w-]*:[^\s"\']+'), '<arn>'),
+    (re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:?\d{2})?'), '<time>'),
+    (re.compile(r'\b[ie]-[0-9a-f]{8,17}\b'), '<instance>'),
+    (re.compile(r'(?i)\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b'), '<uuid>'),
+    (re.compile(r'\b\d{6,}\b'), '<num>'),
+]
+
+# 같은 스테이지/상태/에러 메시지가 이미 기록돼 있으면(중복 이벤트) 쓰지 않음
+# (같은 스테이지에서 다른 액션이 다른 이유로 실패하면 새 상태로 기록)
+DUPLICATE_STATE_CONDITION = "attribute_not_exists(#s) OR #s <> :status OR currentStage <> :stage OR errorMessage <> :errMsg"
 
 LOG_GROUP_NAME = "/aws/codebuild/sample-app2-eb-build"
 LOG_GROUP_NAME_DEPLOY = "/aws/codebuild/deployer-project"
 CLOUDWATCH_CONSOLE_BASE = "https://ap-northeast-2.console.aws.amazon.com/cloudwatch/home?region=ap-northeast-2#logs:log-group"
+# 스테이지별 로그 그룹 이름 (URL 인코딩은 모듈 로드 시 한 번만)
+LOG_GROUP_ENCODED = {
+    'Build': urllib.parse.quote_plus(LOG_GROUP_NAME),
+    'Deploy': urllib.parse.quote_plus(LOG_GROUP_NAME_DEPLOY),
+}
 
 def lambda_handler(event, context):
-    print(f"Received event: {json.dumps(event)}")
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Received event: %s", json.dumps(event))
     
     try:
         # --- 3. EventBridge 이벤트 파싱 ---
@@ -46,7 +108,7 @@ def lambda_handler(event, context):
             
             # "Stage" 레벨의 FAILED 이벤트는 무시 (Action 이벤트가 진짜 헤드라인을 가짐)  
             if status == 'FAILED':
-                print(f"Ignoring STAGE-level FAILED event for: {stage_name}")
+                log.info("Ignoring STAGE-level FAILED event for: %s", stage_name)
                 return { 'statusCode': 200 } # 람다 종료-> 이거 안하면 계속 헤더 로그가 덮어씌워짐
 
         elif event['detail-type'] == 'CodePipeline Action Execution State Change':
@@ -56,7 +118,7 @@ def lambda_handler(event, context):
 
             # "Action" 이벤트의 'STARTED', 'SUCCEEDED'는 "Stage" 이벤트와 중복되므로 무시합니다.
             if status != 'FAILED':
-                print(f"Ignoring duplicate ACTION-level {status} event for: {stage_name}")
+                log.info("Ignoring duplicate ACTION-level %s event for: %s", status, stage_name)
                 return { 'statusCode': 200 }
             
             # (이 코드는 "Action: FAILED" 이벤트만 통과시킴)
@@ -67,7 +129,7 @@ def lambda_handler(event, context):
                         break
 
         else:
-            print(f"Ignoring event type: {event['detail-type']}")
+            log.info("Ignoring event type: %s", event['detail-type'])
             return
             
         error_message = ""
@@ -78,71 +140,115 @@ def lambda_handler(event, context):
                 error_message = event['detail']['execution-result']['external-execution-summary']
             except KeyError:
                 error_message = "Unknown error (no execution-summary)."
-            
-            ai_solution = get_bedrock_solution(error_message)
+            # AI 분석(Bedrock)은 알림을 먼저 보낸 뒤 수행 (6단계)
             
         # --- 4. DynamoDB에 상태 업데이트 (쓰기) ---
-        print(f"Updating DynamoDB: Key={pipeline_id}, Stage={stage_name}, Status={status}")
+        log.info("Updating DynamoDB: Key=%s, Stage=%s, Status=%s", pipeline_id, stage_name, status)
+        
+        state_changed = True
         
         # "첫 번째 이벤트" (Source: STARTED)일 때만 전체 구조를 가져옵니다.
         if stage_name == 'Source' and status == 'STARTED':
             try:
-                response = codepipeline_client.get_pipeline(name=pipeline_name)
+                response = codepipeline_client().get_pipeline(name=pipeline_name)
                 stages = response['pipeline']['stages']
                 stage_list = [s['name'] for s in stages] # 예: ['Source', 'Build', 'Deploy']
                 stage_count = len(stage_list) 
                 log_url = generate_log_url(stage_name, build_id)
                 ai_solution = ""
 
-                print(f"Pipeline Structure: {stage_count} stages found: {stage_list}")
+                log.info("Pipeline Structure: %s stages found: %s", stage_count, stage_list)
 
                 # 웹 소켓으로 확장 가능하나 해커톤 시간 상 후순위로 
-                print(f"Updating LATEST_EXECUTION pointer to: {pipeline_id}")
-                table.update_item(
-                    Key={ PK_NAME: "LATEST_EXECUTION" }, # "LATEST_EXECUTION"이라는 "고정된" ID
-                    UpdateExpression="SET latestExecutionId = :pid, lastStartTime = :time",
-                    ExpressionAttributeValues={
-                        ':pid': pipeline_id, # "새 파이프라인 ID"로 덮어쓰기
-                        ':time': event['time'] # "언제 시작했는지" 시간도 저장
-                    }
-                )
-
-                # DynamoDB 저장
-                table.update_item(
-                    Key={ PK_NAME: pipeline_id },
-                    UpdateExpression="SET currentStage = :stage, #s = :status, errorMessage = :errMsg, totalStages = :tc, stageList = :sl, logUrl = :lUrl",
-                    ExpressionAttributeNames={'#s': 'status'}, 
-                    ExpressionAttributeValues={
-                        ':stage': stage_name, # 현재 스테이지 이름 ['Source', 'Build', 'Deploy']
-                        ':status': status, # STARTED, IN_PROGRESS, SUCCEEDED, FAILED
-                        ':errMsg': error_message,
-                        ':tc': stage_count,  # 총 스테이지 개수
-                        ':sl': stage_list,    # 스테이지 이름 목록
-                        ':lUrl': log_url, # 에어 로그
-                        ':ai': ai_solution # AI 에러 로그 반환 
-                    }
-                )
+                log.info("Updating LATEST_EXECUTION pointer to: %s", pipeline_id)
+
+                # LATEST_EXECUTION 포인터 + 파이프라인 항목을 한 번의 요청으로 저장
+                try:
+                    dynamodb.meta.client.transact_write_items(
+                        TransactItems=[
+                            {
+                                'Update': {
+                                    'TableName': TABLE_NAME,
+                                    'Key': serialize_item({ PK_NAME: "LATEST_EXECUTION" }), # "LATEST_EXECUTION"이라는 "고정된" ID
+                                    'UpdateExpression': "SET latestExecutionId = :pid, lastStartTime = :time",
+                                    'ExpressionAttributeValues': serialize_item({
+                                        ':pid': pipeline_id, # "새 파이프라인 ID"로 덮어쓰기
+                                        ':time': event['time'] # "언제 시작했는지" 시간도 저장
+                                    })
+                                }
+                            },
+                            {
+                                'Update': {
+                                    'TableName': TABLE_NAME,
+                                    'Key': serialize_item({ PK_NAME: pipeline_id }),
+                                    'UpdateExpression': "SET currentStage = :stage, #s = :status, errorMessage = :errMsg, totalStages = :tc, stageList = :sl, logUrl = :lUrl, aiSolution = :ai, startTime = :time",
+                                    'ConditionExpression': DUPLICATE_STATE_CONDITION,
+                                    'ExpressionAttributeNames': {'#s': 'status'},
+                                    'ExpressionAttributeValues': serialize_item({
+                                        ':stage': stage_name, # 현재 스테이지 이름 ['Source', 'Build', 'Deploy']
+                                        ':status': status, # STARTED, IN_PROGRESS, SUCCEEDED, FAILED
+                                        ':errMsg': error_message,
+                                        ':tc': stage_count,  # 총 스테이지 개수
+                                        ':sl': stage_list,    # 스테이지 이름 목록
+                                        ':lUrl': log_url, # 에어 로그
+                                        ':ai': ai_solution, # AI 에러 로그 반환 
+                                        ':time': event['time'] # LATEST_EXECUTION 비교용 시작 시간
+                                    })
+                                }
+                            }
+                        ]
+                    )
+                except dynamodb.meta.client.exceptions.TransactionCanceledException as e:
+                    # 파이프라인 항목 조건 실패 = 중복 이벤트 (그 외 취소 사유는 상위에서 처리)
+                    reasons = e.response.get('CancellationReasons', [])
+                    if not any(r.get('Code') == 'ConditionalCheckFailed' for r in reasons):
+                        raise
+                    log.info("Duplicate event skipped: Key=%s, Stage=%s, Status=%s", pipeline_id, stage_name, status)
+                    state_changed = False
             except Exception as e:
-                print(f"Error getting pipeline structure: {e}")
-                update_simple_status(pipeline_id, stage_name, status, error_message, build_id=build_id, ai_solution=ai_solution)
+                log.error("Error getting pipeline structure: %s", e)
+                # 구조 조회/트랜잭션이 실패해도 LATEST_EXECUTION 포인터는 반드시 갱신
+                update_latest_execution(pipeline_id, event['time'])
+                state_changed = update_simple_status(pipeline_id, stage_name, status, error_message, build_id=build_id, ai_solution=ai_solution, start_time=event['time'])
         
         else:
             # "첫 번째 이벤트"가 아닐 경우, 상태만 업데이트
-            update_simple_status(pipeline_id, stage_name, status, error_message, build_id=build_id, ai_solution=ai_solution)
+            state_changed = update_simple_status(pipeline_id, stage_name, status, error_message, build_id=build_id, ai_solution=ai_solution)
+
+        # 중복 이벤트면 알림/AI 분석 생략
+        if not state_changed:
+            return { 'statusCode': 200 }
+
+        # --- 5. 알림 보내기 (AI 분석을 기다리지 않고 바로 전송) ---
+        notify_futures = send_notification(pipeline_id, stage_name, status, error_message)
 
-        # --- 5. 알림 보내기 ---
-        send_notification(pipeline_id, stage_name, status, error_message, ai_solution)
+        # --- 6. FAILED: AI 분석 결과를 DB에 추가하고 후속 알림 전송 ---
+        if status == 'FAILED':
+            ai_solution, ai_succeeded = get_bedrock_solution(error_message)
+            update_ai_solution(pipeline_id, ai_solution)
+            # 실패 알림 전송을 먼저 기다림 (최대 NOTIFY_TIMEOUT, 초과 시 순서는 보장되지 않음)
+            wait(notify_futures, timeout=NOTIFY_TIMEOUT)
+            # Bedrock 오류 안내 문구는 DB에만 남기고 후속 알림은 보내지 않음
+            if ai_succeeded:
+                notify_futures = dispatch_message(f"🤖 [Deploy Land] '{pipeline_id[:8]}' **AI 분석 추가:**\n> {ai_solution}")
+
+        wait(notify_futures, timeout=NOTIFY_TIMEOUT)
 
         return { 'statusCode': 200 }
 
     except Exception as e:
-        print(f"Error processing event: {e}")
+        log.error("Error processing event: %s", e)
         return { 'statusCode': 200, 'body': json.dumps(f"Error: {str(e)}") }
 
 # --- Bedrock API 호출 헬퍼 함수 ---
 def get_bedrock_solution(error_headline):
-    import time
-    
+    """(AI 답변 또는 오류 안내 문구, 실제 AI 답변 여부) 반환"""
+    cache_key = get_bedrock_cache_key(error_headline)
+    cached_solution = get_cached_solution(cache_key)
+    if cached_solution:
+        log.info("Bedrock cache hit: %s", cache_key)
+        return cached_solution, True
+
     try:
         prompt = f"""
         AWS CodePipeline 빌드가 실패했습니다.
@@ -152,69 +258,103 @@ def get_bedrock_solution(error_headline):
         
         body = json.dumps({
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": 500,
+            "max_tokens": 200,
             "messages": [
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            "temperature": 0.7,
+            "temperature": 0.3,
             "top_p": 0.9
         })
         
-        print(f"Calling Bedrock - Model: {BEDROCK_MODEL_ID}, Region: ap-northeast-2")
-        
-        # Exponential backoff 재시도 로직
-        max_retries = 3
-        base_delay = 2
-        
-        for attempt in range(max_retries):
-            try:
-                response = bedrock_runtime.invoke_model(
-                    body=body,
-                    modelId=BEDROCK_MODEL_ID,
-                    contentType='application/json',
-                    accept='application/json'
-                )
-                break
-                
-            except Exception as retry_error:
-                if "ThrottlingException" in str(retry_error) and attempt < max_retries - 1:
-                    wait_time = base_delay * (2 ** attempt)
-                    print(f"ThrottlingException 발생. {wait_time}초 후 재시도... (시도 {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                else:
-                    raise
+        try:
+            response = invoke_bedrock_model(body, BEDROCK_MODEL_ID)
+        except Exception as model_error:
+            # 기본(Haiku) 모델 검증 실패 시에만 Sonnet으로 재시도
+            if "ValidationException" not in str(model_error):
+                raise
+            log.warning("Model %s failed validation, falling back to %s", BEDROCK_MODEL_ID, BEDROCK_FALLBACK_MODEL_ID)
+            response = invoke_bedrock_model(body, BEDROCK_FALLBACK_MODEL_ID)
         
         response_body = json.loads(response.get('body').read())
-        print(f"Bedrock response: {json.dumps(response_body)}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Bedrock response: %s", json.dumps(response_body))
         
         if 'content' in response_body and len(response_body['content']) > 0:
-            solution_text = response_body['content'][0].get('text', 'AI가 응답을 생성하지 못했습니다.')
+            solution_text = response_body['content'][0].get('text')
+            if not solution_text:
+                return 'AI가 응답을 생성하지 못했습니다.', False
+            put_cached_solution(cache_key, solution_text)
         else:
-            solution_text = 'AI 응답 형식이 올바르지 않습니다.'
+            return 'AI 응답 형식이 올바르지 않습니다.', False
         
-        print(f"Bedrock Solution: {solution_text}")
-        return solution_text
+        log.info("Bedrock Solution: %s", solution_text)
+        return solution_text, True
         
     except Exception as e:
         error_msg = str(e)
-        print(f"Error calling Bedrock: {error_msg}")
-        print(f"Error type: {type(e).__name__}")
+        log.error("Error calling Bedrock: %s", error_msg)
+        log.error("Error type: %s", type(e).__name__)
         
         if "ValidationException" in error_msg:
-            return "모델 ID가 잘못되었거나 해당 리전에서 사용할 수 없는 모델입니다."
+            return "모델 ID가 잘못되었거나 해당 리전에서 사용할 수 없는 모델입니다.", False
         elif "AccessDeniedException" in error_msg:
-            return "Bedrock 모델 액세스 권한이 없습니다. IAM 정책을 확인하세요."
+            return "Bedrock 모델 액세스 권한이 없습니다. IAM 정책을 확인하세요.", False
         elif "ResourceNotFoundException" in error_msg:
-            return "요청한 모델을 찾을 수 없습니다. 모델 ID와 리전을 확인하세요."
+            return "요청한 모델을 찾을 수 없습니다. 모델 ID와 리전을 확인하세요.", False
         else:
-            return f"Bedrock AI 호출 실패: {error_msg}"
+            return f"Bedrock AI 호출 실패: {error_msg}", False
+
+
+# --- Bedrock 모델 호출 (Throttling 재시도는 클라이언트 adaptive 모드가 처리) ---
+def invoke_bedrock_model(body, model_id):
+    log.info("Calling Bedrock - Model: %s, Region: ap-northeast-2", model_id)
+    return bedrock_runtime().invoke_model(
+        body=body,
+        modelId=model_id,
+        contentType='application/json',
+        accept='application/json'
+    )
+
+
+# --- 저수준 DynamoDB 형식 변환 헬퍼 함수 ---
+def serialize_item(values):
+    return {k: serializer.serialize(v) for k, v in values.items()}
 
+# --- Bedrock 응답 캐시 헬퍼 함수 ---
+def get_bedrock_cache_key(error_headline):
+    normalized = error_headline.strip()
+    for pattern, replacement in ERROR_NORMALIZE_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    normalized = normalized.lower()
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+def get_cached_solution(cache_key):
+    try:
+        item = bedrock_cache_table.get_item(Key={BEDROCK_CACHE_PK_NAME: cache_key}).get('Item')
+        # DynamoDB TTL 삭제는 지연될 수 있으므로 만료 시간 직접 확인
+        if not item or int(item.get('ttl', 0)) < time.time():
+            return ""
+        return item.get('aiSolution', "")
+    except Exception as e:
+        log.error("Error reading Bedrock cache: %s", e)
+        return ""
+
+def put_cached_solution(cache_key, solution_text):
+    try:
+        bedrock_cache_table.put_item(Item={
+            BEDROCK_CACHE_PK_NAME: cache_key,
+            'aiSolution': solution_text,
+            'ttl': int(time.time()) + BEDROCK_CACHE_TTL
+        })
+    except Exception as e:
+        log.error("Error writing Bedrock cache: %s", e)
 
 # --- 상태만 간단히 업데이트하는 헬퍼 함수 ---
-def update_simple_status(pipeline_id, stage_name, status, error_message, build_id=None, ai_solution=""):
+def update_simple_status(pipeline_id, stage_name, status, error_message, build_id=None, ai_solution="", start_time=None):
+    """상태를 기록하고, 중복 이벤트라서 기록하지 않았으면 False 반환"""
     log_url = generate_log_url(stage_name, build_id)
     
     UpdateExpression = "SET currentStage = :stage, #s = :status, errorMessage = :errMsg, logUrl = :lUrl, aiSolution = :ai"
@@ -227,32 +367,60 @@ def update_simple_status(pipeline_id, stage_name, status, error_message, build_i
         ':ai': ai_solution
     }
 
-    table.update_item(
-        Key={ PK_NAME: pipeline_id },
-        UpdateExpression=UpdateExpression,
-        ExpressionAttributeNames={'#s': 'status'}, 
-        ExpressionAttributeValues= ExpressionAttributeValues
-    )
+    if start_time:
+        UpdateExpression += ", startTime = :time"
+        ExpressionAttributeValues[':time'] = start_time
+
+    try:
+        table.update_item(
+            Key={ PK_NAME: pipeline_id },
+            UpdateExpression=UpdateExpression,
+            ConditionExpression=DUPLICATE_STATE_CONDITION,
+            ExpressionAttributeNames={'#s': 'status'}, 
+            ExpressionAttributeValues= ExpressionAttributeValues
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        log.info("Duplicate event skipped: Key=%s, Stage=%s, Status=%s", pipeline_id, stage_name, status)
+        return False
+    return True
+
+# --- LATEST_EXECUTION 포인터만 갱신하는 헬퍼 함수 ---
+def update_latest_execution(pipeline_id, start_time):
+    try:
+        table.update_item(
+            Key={ PK_NAME: "LATEST_EXECUTION" },
+            UpdateExpression="SET latestExecutionId = :pid, lastStartTime = :time",
+            # 늦게 도착한 이전 실행의 이벤트가 포인터를 되돌리지 않도록
+            ConditionExpression="attribute_not_exists(lastStartTime) OR lastStartTime <= :time",
+            ExpressionAttributeValues={ ':pid': pipeline_id, ':time': start_time }
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        log.info("LATEST_EXECUTION already points to a newer run than %s", pipeline_id)
+    except Exception as e:
+        log.error("Error updating LATEST_EXECUTION: %s", e)
+
+# --- AI 분석 결과만 추가 저장하는 헬퍼 함수 ---
+def update_ai_solution(pipeline_id, ai_solution):
+    try:
+        table.update_item(
+            Key={ PK_NAME: pipeline_id },
+            UpdateExpression="SET aiSolution = :ai",
+            ExpressionAttributeValues={ ':ai': ai_solution }
+        )
+    except Exception as e:
+        log.error("Error saving AI solution: %s", e)
 
 # --- Log URL 생성 헬퍼 함수 ---
 def generate_log_url(stage_name, build_id):
     # 'Source' 단계는 로그가 없음,  Build/Deploy 단계에서만 생성
-    if stage_name in ('Build', 'Deploy') and build_id:
-        log_group = ""
-        if stage_name == 'Build':
-            log_group = LOG_GROUP_NAME
-        elif stage_name == 'Deploy':
-            log_group = LOG_GROUP_NAME_DEPLOY
-        else:
-            return ""
-        log_group_encoded = urllib.parse.quote_plus(log_group)
+    log_group_encoded = LOG_GROUP_ENCODED.get(stage_name)
+    if log_group_encoded and build_id:
         log_stream_encoded = urllib.parse.quote_plus(build_id)
-
         return f"{CLOUDWATCH_CONSOLE_BASE}/{log_group_encoded}/log-stream/{log_stream_encoded}"
     return ""
 
 # --- 알림 전송 헬퍼 함수 ---
-def send_notification(pipeline_id, stage_name, status, error_message, ai_solution=""):
+def send_notification(pipeline_id, stage_name, status, error_message):
     message = ""
 
     if status == 'STARTED' and stage_name == 'Source':
@@ -273,14 +441,19 @@ def send_notification(pipeline_id, stage_name, status, error_message, ai_solutio
         item = get_item_from_db(pipeline_id)
         log_url = item.get('logUrl', '')
 
-        if ai_solution:
-            message += f"\n** お父さんの　ワン :**\n> {ai_solution}"
         if log_url:
             message += f"\n> **로그 확인:** {log_url}"
             
     if message:
-        if DISCORD_URL: send_discord_notification(message)
-        if SLACK_URL: send_slack_notification(message.replace("**", "*"))
+        return dispatch_message(message)
+    return []
+
+# --- 디스코드/슬랙 병렬 전송 (완료 대기는 호출한 쪽에서) ---
+def dispatch_message(message):
+    futures = []
+    if DISCORD_URL: futures.append(notify_executor.submit(send_discord_notification, message))
+    if SLACK_URL: futures.append(notify_executor.submit(send_slack_notification, message.replace("**", "*")))
+    return futures
 
 # --- DB에서 값들 가져오기 ---
 def get_item_from_db(pipeline_id):
@@ -290,26 +463,27 @@ def get_item_from_db(pipeline_id):
     except Exception:
         return {}
         
+# --- 웹훅 HTTPS 연결 재사용 (스레드 안전한 urllib3 풀, warm 컨테이너에서 유지) ---
+_WEBHOOK_POOL = urllib3.PoolManager(num_pools=2, maxsize=2, timeout=urllib3.Timeout(total=NOTIFY_TIMEOUT))
+# POST는 멱등이 아니므로 요청을 보내기 전 연결 실패만 한 번 재시도 (끊긴 keep-alive 연결은 풀이 재사용 전에 걸러냄)
+_WEBHOOK_RETRIES = urllib3.Retry(total=1, connect=1, read=0, redirect=0, status=0, other=0)
+
+def post_json(url_string, body):
+    return _WEBHOOK_POOL.request(
+        'POST', url_string,
+        body=json.dumps(body),
+        headers={'Content-Type': 'application/json'},
+        retries=_WEBHOOK_RETRIES
+    )
+
 # --- Discord 알림 헬퍼 함수 ---
 def send_discord_notification(message):
     try:
-        url = http.client.urlsplit(DISCORD_URL)
-        conn = http.client.HTTPSConnection(url.hostname)
-        payload = json.dumps({'content': message}) 
-        headers = {'Content-Type': 'application/json'}
-        conn.request("POST", url.path, payload, headers)
-        conn.getresponse()
-        conn.close()
-    except Exception as e: print(f"Error sending to Discord: {e}")
+        post_json(DISCORD_URL, {'content': message})
+    except Exception as e: log.error("Error sending to Discord: %s", e)
 
 # --- Slack 알림 헬퍼 함수 ---
 def send_slack_notification(message):
     try:
-        url = http.client.urlsplit(SLACK_URL)
-        conn = http.client.HTTPSConnection(url.hostname)
-        payload = json.dumps({'text': message})
-        headers = {'Content-Type': 'application/json'}
-        conn.request("POST", url.path, payload, headers)
-        conn.getresponse()
-        conn.close()
-    except Exception as e: print(f"Error sending to Slack: {e}")
\ No newline at end of file
+        post_json(SLACK_URL, {'text': message})
+    except Exception as e: log.error("Error sending to Slack: %s", e)
\ No newline at end of file